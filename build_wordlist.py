@@ -6,17 +6,30 @@ extracts every word file, and produces a clean list of 5-letter
 English words saved as both .txt and .json.
 
 Requirements: Python 3.7+  (no third-party packages needed)
-Usage:        python build_wordlist.py
+Usage:        python build_wordlist.py [--cache] [--refresh]
+
+  --cache   keep the downloaded tarball in the user cache directory and
+            revalidate it (ETag / If-Modified-Since) on later runs instead
+            of streaming it straight from the network every time
+
+  --refresh rebuild even if the existing word list is still fresh (younger
+            than MAX_OUTPUT_AGE_DAYS); without it such a run is a no-op
 """
 
+import argparse
+import contextlib
+import gzip
 import json
 import os
 import re
+import shutil
+import subprocess
 import sys
 import tarfile
-import tempfile
+import time
 import urllib.error
 import urllib.request
+from email.utils import formatdate
 
 # ── Configuration ──────────────────────────────────────────────────────────────
 
@@ -31,6 +44,16 @@ SCRIPT_DIR   = os.path.dirname(os.path.abspath(__file__))
 OUT_TXT      = os.path.join(SCRIPT_DIR, "five_letter_words.txt")
 OUT_JSON     = os.path.join(SCRIPT_DIR, "five_letter_words.json")
 
+# An existing word list younger than this is reused unless --refresh is given
+MAX_OUTPUT_AGE_DAYS = 30
+
+# Where --cache keeps the downloaded tarball (plus its ETag in a sidecar file)
+CACHE_DIR     = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "wordlist-builder",
+)
+CACHED_TARBALL = os.path.join(CACHE_DIR, "scowl.tar.gz")
+
 # SCOWL size levels to include (10–70 = common English; 80–95 = rare/technical)
 # Increase MAX_LEVEL to 95 if you want a larger but noisier word list.
 MIN_LEVEL = 10
@@ -69,34 +92,76 @@ def get_download_url() -> str:
 
 # ── Step 2: Download the tarball ───────────────────────────────────────────────
 
+class ProgressReader:
+    """
+    Wrap a readable stream and print download progress while it is read,
+    at most once per `interval` seconds so the terminal isn't flooded.
+    """
+
+    def __init__(self, stream, total: int, interval: float = 1.0):
+        self.stream = stream
+        self.total = total
+        self.interval = interval
+        self.downloaded = 0
+        self._last_report = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        self.downloaded += len(chunk)
+        now = time.monotonic()
+        if self.total and (not chunk or now - self._last_report >= self.interval):
+            self._last_report = now
+            pct = self.downloaded / self.total * 100
+            print(f"\r    {self.downloaded:,} / {self.total:,} bytes  ({pct:.1f}%)",
+                  end="", flush=True)
+        return chunk
+
+
 def download_tarball(url: str, dest: str) -> None:
     """
     Stream-download the tarball at `url` into `dest`, printing progress.
+    If `dest` already exists the request is made conditional on its ETag
+    (kept in `dest`.etag) and modification time, and a 304 Not Modified
+    answer reuses the file as-is.
     Raises SystemExit on failure so the user gets a clear error message.
     """
     print(f"[2/5] Downloading SCOWL …")
+    etag_path = dest + ".etag"
+    part_path = dest + ".part"
     try:
         req = urllib.request.Request(
             url, headers={"User-Agent": "WordlistBuilder/1.0"}
         )
+        if os.path.exists(dest):
+            if os.path.exists(etag_path):
+                with open(etag_path, encoding="utf-8") as f:
+                    req.add_header("If-None-Match", f.read().strip())
+            req.add_header("If-Modified-Since",
+                           formatdate(os.path.getmtime(dest), usegmt=True))
+
+        # Download next to `dest` and rename at the end, so an interrupted
+        # run never leaves a truncated tarball behind in the cache.
         with urllib.request.urlopen(req, timeout=60) as resp, \
-             open(dest, "wb") as out_file:
+             open(part_path, "wb") as out_file:
 
             total = int(resp.headers.get("Content-Length", 0))
-            downloaded = 0
-            chunk_size = 64 * 1024  # 64 KB chunks
-
-            while True:
-                chunk = resp.read(chunk_size)
-                if not chunk:
-                    break
-                out_file.write(chunk)
-                downloaded += len(chunk)
-                if total:
-                    pct = downloaded / total * 100
-                    print(f"\r    {downloaded:,} / {total:,} bytes  ({pct:.1f}%)",
-                          end="", flush=True)
+            reader = ProgressReader(resp, total)
+            shutil.copyfileobj(reader, out_file, length=1024 * 1024)  # 1 MB
             print()  # newline after progress bar
+            etag = resp.headers.get("ETag")
+
+        os.replace(part_path, dest)
+        if etag:
+            with open(etag_path, "w", encoding="utf-8") as f:
+                f.write(etag)
+        elif os.path.exists(etag_path):
+            os.remove(etag_path)
+
+    except urllib.error.HTTPError as exc:
+        if exc.code != 304:
+            print(f"\n✖  Download failed: {exc}", file=sys.stderr)
+            sys.exit(1)
+        print("    Not modified since last download; using cached copy.")
 
     except urllib.error.URLError as exc:
         print(f"\n✖  Download failed: {exc}", file=sys.stderr)
@@ -106,113 +171,190 @@ def download_tarball(url: str, dest: str) -> None:
     print(f"    Saved to: {dest}")
 
 
-# ── Step 3: Extract word files ─────────────────────────────────────────────────
+# ── Step 3 & 4: Extract and filter word files ──────────────────────────────────
 
 # SCOWL word-file names look like:
-#   english-words.10, english-words.20, american-words.35, …
+#   english-words.10, american-words.35, british_z-words.50, variant_1-words.60, …
 # The numeric suffix is the "size level" (10 = most common, 95 = most obscure).
-WORD_FILE_PATTERN = re.compile(
-    r"(english|american|british|canadian|australian|variant|."
-    r"*-words?)\."
-    r"(\d+)$",
-    re.IGNORECASE,
+# Only these spelling families are used; other SCOWL lists (proper names,
+# abbreviations, upper-case, contractions, …) are deliberately skipped.
+WORD_FILE_LANGUAGES = frozenset(
+    {"english", "american", "british", "canadian", "australian", "variant"}
 )
 
-def extract_words(tarball_path: str) -> list[str]:
+# One whole line consisting of exactly five (lowercase) ASCII letters.
+# Surrounding blanks and a trailing CR (Windows line endings) are tolerated,
+# like str.strip() would.  Anything else — comments, apostrophes, hyphens,
+# digits, accented letters (which are multi-byte in UTF-8) — never matches.
+FIVE_LETTER_LINE = re.compile(rb"(?m)^[ \t]*([a-z]{5})[ \t\r]*$")
+
+def _filter_blob(blob: bytes) -> set[int]:
     """
-    Open the tarball, iterate every member whose name matches the SCOWL
-    word-file pattern and whose size level falls within [MIN_LEVEL, MAX_LEVEL],
-    and collect all lines as raw word candidates.
+    Return the distinct lowercase 5-letter words in one word file, each packed
+    into a 40-bit int: five ASCII bytes pack uniquely into 40 bits, which
+    makes a smaller set entry than the bytes object itself.
     """
-    print(f"[3/5] Extracting word files (levels {MIN_LEVEL}–{MAX_LEVEL}) …")
-    raw_words: list[str] = []
-    files_read = 0
+    # Lowercase the whole blob in one C-level pass first, so the regex only
+    # needs a single character class and matches come out ready to dedup.
+    # A single findall() then runs the whole scan inside the C regex engine
+    # instead of paying Python-level overhead for every line.
+    return {int.from_bytes(word, "big")
+            for word in FIVE_LETTER_LINE.findall(blob.lower())}
 
-    try:
-        with tarfile.open(tarball_path, "r:gz") as tar:
-            for member in tar.getmembers():
-                filename = os.path.basename(member.name)
-                match = WORD_FILE_PATTERN.match(filename)
-                if not match:
-                    continue
-
-                level = int(match.group(2))
-                if not (MIN_LEVEL <= level <= MAX_LEVEL):
-                    continue
-
-                # Read the file member as text
-                fobj = tar.extractfile(member)
-                if fobj is None:
-                    continue
-
-                try:
-                    text = fobj.read().decode("utf-8", errors="ignore")
-                except Exception:
-                    continue
-
-                lines = text.splitlines()
-                raw_words.extend(lines)
-                files_read += 1
-
-    except tarfile.TarError as exc:
-        print(f"\n✖  Failed to read tarball: {exc}", file=sys.stderr)
-        sys.exit(1)
 
-    print(f"    {files_read} word files read → {len(raw_words):,} raw lines")
-    return raw_words
+# Read size used between tarfile and the (decompressing) stream underneath
+# it.  tarfile's streaming mode defaults to 10 KB reads; bigger reads mean far
+# fewer round trips into gzip/zlib, the pigz pipe, or the HTTP socket.
+READ_BUFFER_SIZE = 1 << 20  # 1 MB
 
-
-# ── Step 4 & 5: Filter, clean, deduplicate, sort ──────────────────────────────
-
-def process_words(raw_words: list[str]) -> list[str]:
+@contextlib.contextmanager
+def open_decompressed(tarball_path: str):
     """
-    From the raw lines, keep only tokens that are:
-      • Exactly 5 characters long
-      • Composed solely of ASCII letters (a–z / A–Z)
-    Then lowercase, deduplicate, and sort alphabetically.
+    Yield a binary stream of the *decompressed* tarball contents.
+    Uses `pigz -dc` (parallel inflate) when it is installed, otherwise the
+    stdlib gzip module, so tarfile only has to deal with raw tar bytes.
     """
-    print("[4/5] Filtering, deduplicating, and sorting …")
-
-    seen:  set[str]  = set()
-    clean: list[str] = []
+    if shutil.which("pigz"):
+        proc = subprocess.Popen(["pigz", "-dc", tarball_path],
+                                stdout=subprocess.PIPE,
+                                bufsize=READ_BUFFER_SIZE)
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        if proc.returncode not in (0, -13):  # -13: SIGPIPE if we stop early
+            raise OSError(f"pigz exited with status {proc.returncode}")
+    else:
+        with gzip.open(tarball_path, "rb") as stream:
+            yield stream
+
+
+def read_word_files(tar: tarfile.TarFile) -> set[int]:
+    """
+    Iterate every member of an open tarball whose name matches a SCOWL word
+    file and whose size level falls within [MIN_LEVEL, MAX_LEVEL], filter
+    each one as soon as it is read, and return the deduplicated set of packed
+    5-letter words from all of them.
+    """
+    seen: set[int] = set()
+    files_read = 0
+    line_count = 0
 
-    for line in raw_words:
-        # A single SCOWL line may contain one word (possibly with trailing
-        # whitespace, a possessive marker, etc.).  Strip and take the bare token.
-        word = line.strip()
+    for member in tar:
+        # Directories, links and pax headers carry no word data
+        if not member.isfile():
+            continue
 
-        # Skip blank lines and comment lines
-        if not word or word.startswith("#"):
+        # Cheapest tests first: most members (READMEs, scripts, other
+        # lists) are rejected by a single substring check.
+        filename = member.name.rpartition("/")[2]
+        if "-word" not in filename:
             continue
 
-        # Keep only purely alphabetic characters (rejects apostrophes, hyphens,
-        # digits, accented letters, etc.)
-        if not word.isalpha():
+        # "<language>-words.<level>", picked apart with plain string splits
+        stem, dot, suffix = filename.rpartition(".")
+        if not dot or not suffix.isdigit():
             continue
 
-        # Enforce ASCII-only (no accented / unicode letters)
-        try:
-            word.encode("ascii")
-        except UnicodeEncodeError:
+        level = int(suffix)
+        if not (MIN_LEVEL <= level <= MAX_LEVEL):
             continue
 
-        # Exactly 5 letters
-        if len(word) != 5:
+        if not stem.endswith(("-words", "-word")):
             continue
 
-        word_lower = word.lower()
+        # "variant_1" / "british_z" belong to their base family
+        language = stem.rpartition("-")[0].partition("_")[0].lower()
+        if language not in WORD_FILE_LANGUAGES:
+            continue
 
-        # Deduplicate
-        if word_lower in seen:
+        fobj = tar.extractfile(member)
+        if fobj is None:
             continue
-        seen.add(word_lower)
-        clean.append(word_lower)
 
-    # Sort alphabetically
-    clean.sort()
+        # Filter right away, so only one word file's raw bytes are ever held
+        # in memory; decoding happens once, after sorting.
+        blob = fobj.read()
+        line_count += blob.count(b"\n")
+        seen |= _filter_blob(blob)
+        files_read += 1
+
+    print(f"    {files_read} word files read → {line_count:,} raw lines")
+    return seen
+
+
+def extract_words(tarball_path: str) -> set[int]:
+    """
+    Extract and filter the SCOWL word files from a tarball previously saved
+    to disk by download_tarball().
+    """
+    print(f"[3/5] Extracting and filtering word files "
+          f"(levels {MIN_LEVEL}–{MAX_LEVEL}) …")
+    try:
+        # "r|" is tarfile's streaming mode: it never seeks, so members must be
+        # consumed in archive order — which is exactly how we iterate them.
+        with open_decompressed(tarball_path) as stream, \
+             tarfile.open(fileobj=stream, mode="r|",
+                          bufsize=READ_BUFFER_SIZE) as tar:
+            return read_word_files(tar)
+
+    except (tarfile.TarError, OSError) as exc:
+        print(f"\n✖  Failed to read tarball: {exc}", file=sys.stderr)
+        sys.exit(1)
+
 
-    print(f"    {len(clean):,} unique 5-letter words retained")
-    return clean
+def stream_extract(url: str) -> set[int]:
+    """
+    Download the tarball at `url` and extract and filter the SCOWL word files
+    from the HTTP response as it arrives, without writing the archive to disk.
+    Raises SystemExit on failure so the user gets a clear error message.
+    """
+    print("[2/5] Downloading SCOWL (streamed, not saved to disk) …")
+    print(f"[3/5] Extracting and filtering word files "
+          f"(levels {MIN_LEVEL}–{MAX_LEVEL}) …")
+    try:
+        req = urllib.request.Request(
+            url, headers={"User-Agent": "WordlistBuilder/1.0"}
+        )
+        # The HTTP response cannot seek, hence pipe mode "r|gz"
+        with urllib.request.urlopen(req, timeout=60) as resp, \
+             tarfile.open(fileobj=resp, mode="r|gz",
+                          bufsize=READ_BUFFER_SIZE) as tar:
+            return read_word_files(tar)
+
+    except urllib.error.URLError as exc:
+        print(f"\n✖  Download failed: {exc}", file=sys.stderr)
+        print("   Check your internet connection and try again.", file=sys.stderr)
+        sys.exit(1)
+
+    except (tarfile.TarError, OSError) as exc:
+        print(f"\n✖  Failed to read tarball: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+# ── Step 5: Sort ───────────────────────────────────────────────────────────────
+
+def process_words(unique: set[int]) -> list[str]:
+    """
+    Turn the deduplicated set of packed words collected during extraction
+    (see _filter_blob) into a sorted list of plain lowercase strings.
+    """
+    print("[4/5] Sorting …")
+
+    # Big-endian packing keeps the ints in the same order as the words, so
+    # sorting them sorts the list.
+    # Sort straight off the dedup set — there is no parallel list to keep.
+    # The order is kept on purpose so regenerated files diff cleanly.
+    clean = sorted(unique)
+
+    # The pattern already guarantees pure ASCII, so there is nothing left to
+    # validate per word: decode everything in one call and split it back up.
+    packed = b"\n".join(n.to_bytes(5, "big") for n in clean)
+    words = packed.decode("ascii").split("\n") if clean else []
+
+    print(f"    {len(words):,} unique 5-letter words retained")
+    return words
 
 
 # ── Step 6: Save outputs ───────────────────────────────────────────────────────
@@ -221,48 +363,79 @@ def save_outputs(words: list[str]) -> None:
     """
     Write the final word list to:
       - five_letter_words.txt  (one word per line, UTF-8)
-      - five_letter_words.json (JSON array, pretty-printed, UTF-8)
+      - five_letter_words.json (JSON array, compact, UTF-8)
     """
     print("[5/5] Saving output files …")
 
-    # Plain text — one word per line
-    with open(OUT_TXT, "w", encoding="utf-8") as f:
-        f.write("\n".join(words) + "\n")
+    # Plain text — one word per line.  Both files get a 1 MB buffer so each
+    # is flushed to disk in as few write() syscalls as possible.
+    with open(OUT_TXT, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("\n".join(words))
+        f.write("\n")
     print(f"    ✔  {OUT_TXT}  ({len(words):,} words)")
 
-    # JSON array
-    with open(OUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(words, f, indent=2, ensure_ascii=True)
-        f.write("\n")
+    # JSON array — built by hand: every word is exactly [a-z]{5}, so there is
+    # nothing to escape and the json encoder would only add overhead.
+    with open(OUT_JSON, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write('["' + '","'.join(words) + '"]\n' if words else "[]\n")
     print(f"    ✔  {OUT_JSON}  ({os.path.getsize(OUT_JSON):,} bytes)")
 
 
 # ── Entry point ────────────────────────────────────────────────────────────────
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build the 5-letter word list from the latest SCOWL release."
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help=f"keep the tarball in {CACHE_DIR} and only re-download it "
+             "when it changed, instead of streaming it every run",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help=f"rebuild even if {os.path.basename(OUT_TXT)} is less than "
+             f"{MAX_OUTPUT_AGE_DAYS} days old",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
+    args = parse_args()
+
+    # The output only changes with new SCOWL releases: skip all the work while
+    # the existing list is fresh enough.
+    if (not args.refresh and os.path.exists(OUT_TXT) and os.path.exists(OUT_JSON)
+            and time.time() - os.path.getmtime(OUT_TXT)
+                < MAX_OUTPUT_AGE_DAYS * 86400):
+        print("Cached wordlist is fresh; use --refresh to rebuild.")
+        return
+
     print("=" * 60)
     print("  SCOWL → 5-Letter Word List Builder")
     print("=" * 60)
 
-    # Work inside a temporary directory so we never leave partial downloads
-    with tempfile.TemporaryDirectory(prefix="scowl_") as tmp_dir:
-        tarball_path = os.path.join(tmp_dir, "scowl.tar.gz")
+    # 1. Resolve URL
+    url = get_download_url()
 
-        # 1. Resolve URL
-        url = get_download_url()
+    if args.cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
 
-        # 2. Download
-        download_tarball(url, tarball_path)
+        # 2. Download (or revalidate the cached copy)
+        download_tarball(url, CACHED_TARBALL)
 
-        # 3. Extract
-        raw = extract_words(tarball_path)
+        # 3 & 4. Extract and filter
+        raw = extract_words(CACHED_TARBALL)
+    else:
+        # 2, 3 & 4. Download, extract and filter in a single streaming pass
+        raw = stream_extract(url)
 
-    # 4 & 5. Filter + sort
+    # 5. Sort
     words = process_words(raw)
 
     if not words:
         print("\n✖  No words found. The SCOWL archive layout may have changed.")
-        print("   Adjust WORD_FILE_PATTERN or MIN/MAX_LEVEL and retry.")
+        print("   Adjust WORD_FILE_LANGUAGES or MIN/MAX_LEVEL and retry.")
         sys.exit(1)
 
     # 6. Write files